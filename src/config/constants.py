@@ -1,3 +1,5 @@
+import os
+
 # Constants
 BUCKET_NAME = "fire-recovery-store"
 STAC_URL = "https://planetarycomputer.microsoft.com/api/stac/v1"
@@ -7,3 +9,12 @@ STAC_STORAGE_DIR = "tmp/stac_geoparquet"
 # NIR_BAND = "nir"
 SWIR_BAND = "B12"
 NIR_BAND = "B8A"
+
+# Set VALIDATE_API_RESPONSE=false to register routes without response models,
+# skipping response validation (e.g. in tests that only check payloads)
+VALIDATE_API_RESPONSE = (
+    os.environ.get("VALIDATE_API_RESPONSE", "true").lower() != "false"
+)
+
+# Set TESTING=1 to defer importing the heavy processing stacks until first use
+TESTING = os.environ.get("TESTING") == "1"
@@ -10,26 +10,68 @@ from fastapi import (
 from pydantic import BaseModel, Field
 import uuid
 import time
-import json
+import msgspec
 import os
 import tempfile
 from typing import Union, Optional, List
 from datetime import datetime
 from geojson_pydantic import FeatureCollection, Feature, Polygon, MultiPolygon
 from shapely.geometry import shape
-from src.process.spectral_indices import process_remote_sensing_data
 from src.util.upload_blob import upload_to_gcs
 from src.stac.stac_geoparquet_manager import STACGeoParquetManager
-from src.config.constants import BUCKET_NAME, STAC_STORAGE_DIR
-from src.util.polygon_ops import polygon_to_valid_geojson
-from src.util.cog_ops import (
-    download_cog_to_temp,
-    crop_cog_with_geometry,
-    create_cog,
+from src.config.constants import (
+    BUCKET_NAME,
+    STAC_STORAGE_DIR,
+    TESTING,
+    VALIDATE_API_RESPONSE,
 )
+from src.util.polygon_ops import polygon_to_valid_geojson
 from contextlib import contextmanager
 from typing import Dict, Any, List, Tuple, ContextManager, Generator
-from src.process.resolve_veg import process_veg_map
+
+# The processing modules pull in dask, stackstac, rioxarray etc. and are only
+# used by background tasks. Load them at startup so import errors surface
+# early, except under TESTING=1 where they are imported on first use.
+if not TESTING:
+    import src.process.spectral_indices
+    import src.process.resolve_veg
+    import src.util.cog_ops  # noqa: F401
+
+
+def process_remote_sensing_data(
+    job_id: str,
+    geometry: Polygon,
+    prefire_date_range: Optional[List[str]],
+    postfire_date_range: Optional[List[str]],
+) -> Dict[str, Any]:
+    """Deferred call to src.process.spectral_indices.process_remote_sensing_data"""
+    from src.process.spectral_indices import process_remote_sensing_data
+
+    return process_remote_sensing_data(
+        job_id=job_id,
+        geometry=geometry,
+        prefire_date_range=prefire_date_range,
+        postfire_date_range=postfire_date_range,
+    )
+
+
+async def process_veg_map(
+    veg_gpkg_url: str,
+    fire_cog_url: str,
+    output_dir: str,
+    job_id: str,
+    severity_breaks: List[float] = None,
+) -> Dict[str, Any]:
+    """Deferred call to src.process.resolve_veg.process_veg_map"""
+    from src.process.resolve_veg import process_veg_map
+
+    return await process_veg_map(
+        veg_gpkg_url=veg_gpkg_url,
+        fire_cog_url=fire_cog_url,
+        output_dir=output_dir,
+        job_id=job_id,
+        severity_breaks=severity_breaks,
+    )
 
 
 @contextmanager
@@ -73,7 +115,7 @@ async def process_and_upload_geojson(
 
     # Create a temporary file and upload it
     with temp_file(
-        suffix=".geojson", content=json.dumps(valid_geojson).encode("utf-8")
+        suffix=".geojson", content=msgspec.json.encode(valid_geojson)
     ) as geojson_path:
         # Upload to GCS
         blob_name = f"{fire_event_name}/{job_id}/{filename}.geojson"
@@ -106,6 +148,12 @@ async def process_cog_with_boundary(
     Returns:
         URL to the uploaded processed COG
     """
+    from src.util.cog_ops import (
+        download_cog_to_temp,
+        crop_cog_with_geometry,
+        create_cog,
+    )
+
     # Download the original COG to a temporary file
     with temp_file(suffix=".tif") as original_cog_path:
         # Download the original COG
@@ -127,6 +175,12 @@ async def process_cog_with_boundary(
     return cog_url
 
 
+# geojson_pydantic models for the GeoJSON types accepted by /upload/geojson
+UPLOADABLE_GEOJSON_MODELS = {
+    "FeatureCollection": FeatureCollection,
+    "Feature": Feature,
+}
+
 # Dictionary to track when job requests were first received
 job_timestamps = {}
 
@@ -213,6 +267,11 @@ class UploadedGeoJSONResponse(BaseResponse):
     uploaded_geojson: str
 
 
+def response_model(model: Any) -> Any:
+    """Response model for a route, or None when response validation is disabled"""
+    return model if VALIDATE_API_RESPONSE else None
+
+
 @router.get("/", tags=["Root"])
 async def root():
     return {"message": "Welcome to the Fire Recovery Backend API"}
@@ -220,7 +279,7 @@ async def root():
 
 @router.post(
     "/process/analyze_fire_severity",
-    response_model=ProcessingStartedResponse,
+    response_model=response_model(ProcessingStartedResponse),
     tags=["Fire Severity"],
 )
 async def analyze_fire_severity(
@@ -320,7 +379,7 @@ async def process_fire_severity(
 
 @router.get(
     "/result/analyze_fire_severity/{fire_event_name}/{job_id}",
-    response_model=Union[TaskPendingResponse, FireSeverityResponse],
+    response_model=response_model(Union[TaskPendingResponse, FireSeverityResponse]),
     tags=["Fire Severity"],
 )
 async def get_fire_severity_result(fire_event_name: str, job_id: str):
@@ -352,7 +411,7 @@ async def get_fire_severity_result(fire_event_name: str, job_id: str):
 
 @router.post(
     "/process/refine",
-    response_model=ProcessingStartedResponse,
+    response_model=response_model(ProcessingStartedResponse),
     tags=["Boundary Refinement"],
 )
 async def refine_fire_boundary(
@@ -443,7 +502,7 @@ async def process_boundary_refinement(
 
 @router.get(
     "/result/refine/{fire_event_name}/{job_id}",
-    response_model=Union[TaskPendingResponse, RefinedBoundaryResponse],
+    response_model=response_model(Union[TaskPendingResponse, RefinedBoundaryResponse]),
     tags=["Boundary Refinement"],
 )
 async def get_refine_result(fire_event_name: str, job_id: str):
@@ -492,7 +551,11 @@ async def get_refine_result(fire_event_name: str, job_id: str):
     )
 
 
-@router.post("/upload/geojson", response_model=UploadedGeoJSONResponse, tags=["Upload"])
+@router.post(
+    "/upload/geojson",
+    response_model=response_model(UploadedGeoJSONResponse),
+    tags=["Upload"],
+)
 async def upload_geojson(request: GeoJSONUploadRequest):
     """
     Upload GeoJSON data for a fire event.
@@ -502,12 +565,10 @@ async def upload_geojson(request: GeoJSONUploadRequest):
 
     try:
         # Validate the GeoJSON using geojson_pydantic
-        if request.geojson.get("type") == "FeatureCollection":
-            validated_geojson = FeatureCollection.model_validate(request.geojson)
-        elif request.geojson.get("type") == "Feature":
-            validated_geojson = Feature.model_validate(request.geojson)
-        else:
-            raise ValueError(f"Unsupported GeoJSON type: {request.geojson.get('type')}")
+        geojson_type = request.geojson.get("type")
+        if geojson_type not in UPLOADABLE_GEOJSON_MODELS:
+            raise ValueError(f"Unsupported GeoJSON type: {geojson_type}")
+        UPLOADABLE_GEOJSON_MODELS[geojson_type].model_validate(request.geojson)
 
         # Process and upload the GeoJSON file
         geojson_url, _, _ = await process_and_upload_geojson(
@@ -532,7 +593,7 @@ async def upload_geojson(request: GeoJSONUploadRequest):
 
 @router.post(
     "/process/resolve_against_veg_map",
-    response_model=ProcessingStartedResponse,
+    response_model=response_model(ProcessingStartedResponse),
     tags=["Vegetation Map Analysis"],
 )
 async def resolve_against_veg_map(
@@ -614,7 +675,7 @@ async def process_veg_map_resolution(
 
 @router.get(
     "/result/resolve_against_veg_map/{fire_event_name}/{job_id}",
-    response_model=Union[TaskPendingResponse, VegMapMatrixResponse],
+    response_model=response_model(Union[TaskPendingResponse, VegMapMatrixResponse]),
     tags=["Vegetation Map Analysis"],
 )
 async def get_veg_map_result(fire_event_name: str, job_id: str):
@@ -1,12 +1,59 @@
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Iterable
 import json
 from datetime import datetime
+import msgspec
+import numpy as np
 from shapely import Polygon as ShapelyPolygon
-from shapely import from_geojson, to_geojson
+from shapely import from_geojson
+from shapely.geometry import mapping
 from geojson_pydantic import Polygon, Feature, FeatureCollection
 from pydantic import ValidationError
 
 
+class FeatureMsg(msgspec.Struct):
+    """Lightweight msgspec mirror of a GeoJSON Feature"""
+
+    type: str
+    geometry: Dict[str, Any]
+    properties: Optional[Dict[str, Any]] = None
+
+
+class FeatureCollectionMsg(msgspec.Struct):
+    """Lightweight msgspec mirror of a GeoJSON FeatureCollection"""
+
+    type: str
+    features: List[FeatureMsg]
+
+    def as_geojson_pydantic(self) -> FeatureCollection:
+        """Convert to a geojson_pydantic FeatureCollection"""
+        return FeatureCollection.model_validate(msgspec.to_builtins(self))
+
+
+def _extract_polygon_geometry(polygon_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extracts the Polygon geometry from either a bare geometry or a Feature-like dict.
+
+    Args:
+        polygon_data: Dictionary containing polygon data
+
+    Returns:
+        The Polygon geometry dictionary
+
+    Raises:
+        ValueError: If no Polygon geometry can be found
+    """
+    # If we have a nested geometry
+    if "geometry" in polygon_data and polygon_data["geometry"].get("type") == "Polygon":
+        return polygon_data["geometry"]
+    # If we have a direct geometry
+    if polygon_data.get("type") == "Polygon" and "coordinates" in polygon_data:
+        return polygon_data
+    raise ValueError(
+        "Invalid polygon data. Expected either a Polygon geometry "
+        "or an object with a geometry property containing a Polygon"
+    )
+
+
 def validate_polygon(polygon_data: Dict[str, Any]) -> ShapelyPolygon:
     """
     Validates a GeoJSON polygon using shapely.
@@ -23,22 +70,7 @@ def validate_polygon(polygon_data: Dict[str, Any]) -> ShapelyPolygon:
     try:
         # Convert the input data to JSON string if it's a dict
         if isinstance(polygon_data, dict):
-            # If we have a nested geometry
-            if (
-                "geometry" in polygon_data
-                and polygon_data["geometry"].get("type") == "Polygon"
-            ):
-                polygon_json = json.dumps(polygon_data["geometry"])
-            # If we have a direct geometry
-            elif (
-                polygon_data.get("type") == "Polygon" and "coordinates" in polygon_data
-            ):
-                polygon_json = json.dumps(polygon_data)
-            else:
-                raise ValueError(
-                    "Invalid polygon data. Expected either a Polygon geometry "
-                    "or an object with a geometry property containing a Polygon"
-                )
+            polygon_json = json.dumps(_extract_polygon_geometry(polygon_data))
 
             # Parse the GeoJSON with shapely
             shapely_geom = from_geojson(polygon_json)
@@ -80,9 +112,13 @@ def polygon_to_feature(
             "created": datetime.utcnow().isoformat(),
         }
 
-    # Get GeoJSON representation of the polygon
-    geojson_str = to_geojson(polygon)
-    geojson_dict = json.loads(geojson_str)
+    # Get GeoJSON representation of the polygon directly as a dict, skipping
+    # the JSON string round-trip. mapping() yields tuples, so convert the
+    # rings to lists to keep the output identical to parsed GeoJSON.
+    geojson_dict = mapping(polygon)
+    geojson_dict["coordinates"] = [
+        np.asarray(ring).tolist() for ring in geojson_dict["coordinates"]
+    ]
 
     # Create feature
     feature = {"type": "Feature", "geometry": geojson_dict, "properties": properties}
@@ -132,6 +168,117 @@ def polygon_to_valid_geojson(
         raise ValueError(f"GeoJSON validation failed: {str(e)}")
 
 
+def polygon_to_valid_geojson_bytes(
+    polygon_data: Dict[str, Any],
+    properties: Optional[Dict[str, Any]] = None,
+    collection_properties: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """
+    Same as polygon_to_valid_geojson, but returns the FeatureCollection already
+    encoded as JSON bytes, e.g. for fastapi.Response(content=...,
+    media_type="application/json") or for writing straight to a file.
+
+    Args:
+        polygon_data: Dictionary containing polygon data
+        properties: Optional properties for the Feature
+        collection_properties: Optional properties for the FeatureCollection
+
+    Returns:
+        UTF-8 encoded JSON of the valid GeoJSON FeatureCollection
+    """
+    return msgspec.json.encode(
+        polygon_to_valid_geojson(polygon_data, properties, collection_properties)
+    )
+
+
+def polygons_to_valid_geojson(
+    polygon_datas: Iterable[Dict[str, Any]],
+    properties_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+    collection_properties: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Batch variant of polygon_to_valid_geojson: validates many polygons at once,
+    builds a single FeatureCollection containing all of them and validates the
+    FeatureCollection exactly once.
+
+    Args:
+        polygon_datas: Iterable of dictionaries containing polygon data
+        properties_list: Optional per-feature properties, aligned with polygon_datas
+        collection_properties: Optional properties for the FeatureCollection
+
+    Returns:
+        Dictionary containing valid GeoJSON FeatureCollection
+    """
+    try:
+        polygon_datas = list(polygon_datas)
+        if properties_list is None:
+            properties_list = [None] * len(polygon_datas)
+        elif len(properties_list) != len(polygon_datas):
+            raise ValueError(
+                f"Expected {len(polygon_datas)} property dicts, "
+                f"got {len(properties_list)}"
+            )
+
+        # Step 1: Parse all polygons with a single vectorized shapely call
+        polygon_jsons = []
+        for polygon_data in polygon_datas:
+            if not isinstance(polygon_data, dict):
+                raise ValueError("Input must be a dictionary")
+            polygon_jsons.append(json.dumps(_extract_polygon_geometry(polygon_data)))
+        # _extract_polygon_geometry only accepts Polygons, so no type check needed
+        shapely_polygons = from_geojson(np.array(polygon_jsons, dtype=object))
+
+        # Step 2: Create all Features and wrap them in one FeatureCollection
+        feature_collection = {
+            "type": "FeatureCollection",
+            "features": [
+                polygon_to_feature(shapely_polygon, properties)
+                for shapely_polygon, properties in zip(
+                    shapely_polygons, properties_list
+                )
+            ],
+        }
+
+        # Step 3: Add collection properties if provided
+        if collection_properties:
+            feature_collection.update(collection_properties)
+
+        # Validate the whole collection once with geojson_pydantic
+        FeatureCollection.model_validate(feature_collection)
+
+        return feature_collection
+
+    except Exception as e:
+        raise ValueError(f"GeoJSON validation failed: {str(e)}")
+
+
+def polygon_to_geojson_struct(
+    polygon_data: Dict[str, Any],
+    properties: Optional[Dict[str, Any]] = None,
+) -> FeatureCollectionMsg:
+    """
+    Validates a polygon and returns a FeatureCollection containing it as a
+    msgspec Struct, for internal callers that don't need geojson_pydantic
+    semantics. Use FeatureCollectionMsg.as_geojson_pydantic() to convert.
+
+    Args:
+        polygon_data: Dictionary containing polygon data
+        properties: Optional properties for the Feature
+
+    Returns:
+        FeatureCollectionMsg containing the validated Feature
+    """
+    try:
+        shapely_polygon = validate_polygon(polygon_data)
+        feature = polygon_to_feature(shapely_polygon, properties)
+        return msgspec.convert(
+            {"type": "FeatureCollection", "features": [feature]},
+            type=FeatureCollectionMsg,
+        )
+    except Exception as e:
+        raise ValueError(f"GeoJSON validation failed: {str(e)}")
+
+
 if __name__ == "__main__":
     # Example usage
     test_polygon = {
@@ -158,4 +305,4 @@ if __name__ == "__main__":
         test_polygon, properties={"name": "Fire Boundary", "id": "fire-123"}
     )
 
-    print(json.dumps(result, indent=2))
+    print(msgspec.json.format(msgspec.json.encode(result), indent=2).decode())
@@ -7,6 +7,10 @@ from minio.error import S3Error
 from pathlib import Path
 from urllib.parse import urlparse
 
+# Parts are sized by Minio (5 MiB unless the file needs more than 10,000
+# parts); each in-flight part is buffered in memory
+NUM_PARALLEL_UPLOADS = 8
+
 
 def upload_to_gcs(source_file: str, bucket_name: str, destination_blob_name: str):
     """Uploads a file to the specified GCS bucket using Minio client."""
@@ -41,6 +45,7 @@ def upload_to_gcs(source_file: str, bucket_name: str, destination_blob_name: str
             destination_blob_name,
             source_file,
             content_type="application/octet-stream",
+            num_parallel_uploads=NUM_PARALLEL_UPLOADS,
         )
 
         print(
@@ -0,0 +1,35 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class StubStacManager:
+    """
+    Lightweight stand-in for STACGeoParquetManager. Lookups return the preset
+    item and created items are recorded as (product, kwargs) tuples.
+    """
+
+    def __init__(self, item: Optional[Dict[str, Any]] = None):
+        self.item = item
+        self.lookups: List[str] = []
+        self.created_items: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def get_item_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
+        self.lookups.append(item_id)
+        return self.item
+
+    async def get_items_by_id_and_coarseness(
+        self, item_id: str, boundary_type: str
+    ) -> Optional[Dict[str, Any]]:
+        self.lookups.append(item_id)
+        return self.item
+
+    async def create_fire_severity_item(self, **kwargs) -> Dict[str, Any]:
+        self.created_items.append(("fire_severity", kwargs))
+        return kwargs
+
+    async def create_boundary_item(self, **kwargs) -> Dict[str, Any]:
+        self.created_items.append(("boundary", kwargs))
+        return kwargs
+
+    async def create_veg_matrix_item(self, **kwargs) -> Dict[str, Any]:
+        self.created_items.append(("veg_matrix", kwargs))
+        return kwargs
@@ -0,0 +1,123 @@
+import httpx
+import pytest
+import pytest_asyncio
+from collections import namedtuple
+from unittest.mock import create_autospec
+from src import app as app_module
+from src.routers import fire_recovery
+from tests._stubs import StubStacManager
+
+# Fixed job ID for tests that don't depend on IDs being unique
+TEST_JOB_ID = "00000000-0000-4000-8000-000000000000"
+SAMPLE_DATETIME = "2024-01-01T00:00:00Z"
+# Metrics written by process_remote_sensing_data, one COG each
+BURN_METRICS = ("prefire_nbr", "postfire_nbr", "dnbr", "rdnbr", "rbr")
+
+
+@pytest.fixture(scope="session")
+def app():
+    return app_module.app
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def job_id():
+    return TEST_JOB_ID
+
+
+@pytest.fixture(scope="module")
+def sample_stac_item(valid_geometry, job_id):
+    """A completed fire severity STAC item, as stored by the STAC manager"""
+    base_url = f"https://storage.googleapis.com/test-bucket/test-fire/{job_id}/"
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": f"test-fire-severity-{job_id}",
+        "properties": {
+            "datetime": SAMPLE_DATETIME,
+            "fire_event_name": "test-fire",
+            "job_id": job_id,
+            "product_type": "fire_severity",
+            "boundary_type": "coarse",
+        },
+        "geometry": valid_geometry,
+        "bbox": [0, 0, 1, 1],
+        "assets": {"rbr": {"href": f"{base_url}rbr.tif"}},
+    }
+
+
+PatchedRouter = namedtuple(
+    "PatchedRouter",
+    [
+        "stac_manager",
+        "upload_to_gcs",
+        "process_remote_sensing_data",
+        "process_veg_map",
+        "process_cog_with_boundary",
+    ],
+)
+
+
+@pytest.fixture(autouse=True)
+def patched_router(monkeypatch):
+    """
+    Replace the fire recovery router's external dependencies (STAC storage, GCS
+    uploads, COG cropping and the heavy processing functions) with mocks for
+    every test. Tests can reconfigure the yielded mocks to simulate other
+    outcomes.
+    """
+    stac_manager = StubStacManager()
+    # Autospec'd with spec_set, so calls with the wrong signature and typo'd
+    # mock attributes fail immediately
+    upload_to_gcs = create_autospec(
+        fire_recovery.upload_to_gcs,
+        spec_set=True,
+        side_effect=lambda source_file, bucket_name, blob_name: (
+            f"https://storage.googleapis.com/{bucket_name}/{blob_name}"
+        ),
+    )
+    process_remote_sensing_data = create_autospec(
+        fire_recovery.process_remote_sensing_data,
+        spec_set=True,
+        return_value={
+            "status": "completed",
+            "output_files": {metric: f"{metric}.tif" for metric in BURN_METRICS},
+        },
+    )
+    process_veg_map = create_autospec(
+        fire_recovery.process_veg_map,
+        spec_set=True,
+        return_value={"status": "completed", "output_csv": "veg_fire_matrix.csv"},
+    )
+
+    def _cropped_cog_url(
+        original_cog_url, valid_geojson, fire_event_name, job_id, output_filename
+    ):
+        blob_name = f"{fire_event_name}/{job_id}/{output_filename}.tif"
+        return upload_to_gcs(original_cog_url, fire_recovery.BUCKET_NAME, blob_name)
+
+    # Skips downloading and cropping the COG, only "uploads" the result
+    process_cog_with_boundary = create_autospec(
+        fire_recovery.process_cog_with_boundary,
+        spec_set=True,
+        side_effect=_cropped_cog_url,
+    )
+
+    mocks = PatchedRouter(
+        stac_manager,
+        upload_to_gcs,
+        process_remote_sensing_data,
+        process_veg_map,
+        process_cog_with_boundary,
+    )
+    for name, mock in mocks._asdict().items():
+        monkeypatch.setattr(fire_recovery, name, mock)
+    return mocks
@@ -1,35 +1,273 @@
+import importlib
+import inspect
 import pytest
-import time
-import uuid
-from unittest.mock import patch, MagicMock
+from fastapi import BackgroundTasks
+from typing import Union
+from pydantic import TypeAdapter, ValidationError
+from src.routers.fire_recovery import (
+    FireSeverityResponse,
+    ProcessingRequest,
+    ProcessingStartedResponse,
+    RefinedBoundaryResponse,
+    TaskPendingResponse,
+    analyze_fire_severity,
+    job_timestamps,
+    process_fire_severity,
+    process_remote_sensing_data,
+    process_veg_map,
+)
 
+JSON_HEADERS = {"Content-Type": "application/json"}
 
-def test_root_endpoint(client):
-    response = client.get("/")
+# Validators for the routes' declared response types, built once per module
+PROCESSING_STARTED_ADAPTER = TypeAdapter(ProcessingStartedResponse)
+FIRE_SEVERITY_RESULT_ADAPTER = TypeAdapter(
+    Union[TaskPendingResponse, FireSeverityResponse]
+)
+REFINE_RESULT_ADAPTER = TypeAdapter(Union[TaskPendingResponse, RefinedBoundaryResponse])
+
+
+async def test_root_endpoint(async_client):
+    response = await async_client.get("/fire-recovery/")
     assert response.status_code == 200
     assert response.json() == {"message": "Welcome to the Fire Recovery Backend API"}
 
 
-def test_process_data(client, valid_request_body):
-    with patch("src.app.process_remote_sensing_data") as mock_process:
-        response = client.post("/process/", json=valid_request_body)
+async def test_process_data(
+    async_client, valid_request_body, valid_request_bytes, patched_router
+):
+    captured = {}
+    processing_result = patched_router.process_remote_sensing_data.return_value
+
+    def _capture(**kwargs):
+        captured.update(kwargs)
+        return processing_result
+
+    patched_router.process_remote_sensing_data.side_effect = _capture
+
+    response = await async_client.post(
+        "/fire-recovery/process/analyze_fire_severity",
+        content=valid_request_bytes,
+        headers=JSON_HEADERS,
+    )
+
+    assert response.status_code == 200
+    assert "job_id" in response.json()
+    assert response.json()["status"] == "Processing started"
+
+    # Verify background task was called with correct parameters
+    assert captured["job_id"] == response.json()["job_id"]
+    assert captured["geometry"] == valid_request_body["geometry"]
+    assert captured["prefire_date_range"] == valid_request_body["prefire_date_range"]
+    uploaded = [call.args[0] for call in patched_router.upload_to_gcs.call_args_list]
+    assert set(processing_result["output_files"].values()) <= set(uploaded)
+    created = [product for product, _ in patched_router.stac_manager.created_items]
+    assert created == ["fire_severity", "boundary"]
+
+
+@pytest.mark.parametrize(
+    "wrapper, module_name",
+    [
+        (process_remote_sensing_data, "src.process.spectral_indices"),
+        (process_veg_map, "src.process.resolve_veg"),
+    ],
+)
+def test_deferred_wrappers_match_processing_signatures(wrapper, module_name):
+    # The router copies these signatures so it can defer the heavy imports
+    wrapped = getattr(importlib.import_module(module_name), wrapper.__name__)
+    assert inspect.signature(wrapper) == inspect.signature(wrapped)
+
 
-        assert response.status_code == 200
-        assert "job_id" in response.json()
-        assert response.json()["status"] == "Processing started"
+def test_patched_processing_checks_signature(patched_router):
+    # The autospec'd mock rejects arguments the real function doesn't take
+    with pytest.raises(TypeError):
+        patched_router.process_remote_sensing_data(job_idd="x", geomtry={})
 
-        # Verify background task was called with correct parameters
-        mock_process.assert_called_once()
 
+async def test_analyze_fire_severity_handler(valid_request_body):
+    # Routing and request validation are covered above; call the handler directly
+    request = ProcessingRequest(**valid_request_body)
+    background_tasks = BackgroundTasks()
 
-def test_result_test_endpoint_pending(client, valid_request_body):
-    # First get a job ID by calling the process-test endpoint
-    response = client.post("/process-test/", json=valid_request_body)
+    result = await analyze_fire_severity(request, background_tasks)
+
+    assert result["status"] == "Processing started"
+    assert job_timestamps.pop(result["job_id"])
+    assert [task.func for task in background_tasks.tasks] == [process_fire_severity]
+
+
+async def test_result_endpoint_pending(async_client, valid_request_bytes):
+    # First get a job ID by starting a fire severity analysis
+    response = await async_client.post(
+        "/fire-recovery/process/analyze_fire_severity",
+        content=valid_request_bytes,
+        headers=JSON_HEADERS,
+    )
     job_id = response.json()["job_id"]
 
-    # Ensure job timestamp is set
-    with patch.dict("src.app.job_timestamps", {job_id: time.time()}):
-        # Test immediate response (should be pending)
-        response = client.get(f"/result-test/{job_id}")
-        assert response.status_code == 200
-        assert response.json()["status"] == "pending"
+    # Test immediate response (should be pending, no STAC item exists yet)
+    response = await async_client.get(
+        f"/fire-recovery/result/analyze_fire_severity/test-fire/{job_id}"
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+
+
+async def test_fire_severity_result_complete(
+    async_client, job_id, sample_stac_item, patched_router
+):
+    patched_router.stac_manager.item = sample_stac_item
+
+    response = await async_client.get(
+        f"/fire-recovery/result/analyze_fire_severity/test-fire/{job_id}"
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "fire_event_name": "test-fire",
+        "status": "complete",
+        "job_id": job_id,
+        "cog_url": sample_stac_item["assets"]["rbr"]["href"],
+    }
+    assert patched_router.stac_manager.lookups == [f"test-fire-severity-{job_id}"]
+
+
+async def test_refine_creates_refined_items(
+    async_client, valid_geometry, job_id, sample_stac_item, patched_router
+):
+    patched_router.stac_manager.item = sample_stac_item
+
+    response = await async_client.post(
+        "/fire-recovery/process/refine",
+        json={
+            "fire_event_name": "test-fire",
+            "refine_geojson": valid_geometry,
+            "job_id": job_id,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "Processing started"
+    crop_call = patched_router.process_cog_with_boundary.await_args
+    assert (
+        crop_call.kwargs["original_cog_url"]
+        == sample_stac_item["assets"]["rbr"]["href"]
+    )
+    assert crop_call.kwargs["output_filename"] == "refined_rbr"
+    created = [
+        (product, kwargs["boundary_type"])
+        for product, kwargs in patched_router.stac_manager.created_items
+    ]
+    assert created == [("fire_severity", "refined"), ("boundary", "refined")]
+
+
+async def test_resolve_against_veg_map_creates_matrix_item(
+    async_client, job_id, sample_stac_item, patched_router, monkeypatch, tmp_path
+):
+    # The background task creates its output directory under the working dir
+    monkeypatch.chdir(tmp_path)
+    patched_router.stac_manager.item = sample_stac_item
+    veg_gpkg_url = "https://storage.googleapis.com/test-bucket/veg.gpkg"
+    fire_cog_url = sample_stac_item["assets"]["rbr"]["href"]
+
+    response = await async_client.post(
+        "/fire-recovery/process/resolve_against_veg_map",
+        json={
+            "fire_event_name": "test-fire",
+            "veg_gpkg_url": veg_gpkg_url,
+            "fire_cog_url": fire_cog_url,
+            "job_id": job_id,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "Processing started"
+    patched_router.process_veg_map.assert_awaited_once_with(
+        veg_gpkg_url=veg_gpkg_url,
+        fire_cog_url=fire_cog_url,
+        output_dir=f"tmp/{job_id}",
+        job_id=job_id,
+    )
+    created = [product for product, _ in patched_router.stac_manager.created_items]
+    assert created == ["veg_matrix"]
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("geometry", None),
+        ("fire_event_name", None),
+        ("geometry", "not-a-geometry"),
+        ("prefire_date_range", "2023-01-01"),
+    ],
+)
+async def test_analyze_fire_severity_rejects_bad_input(
+    async_client, valid_request_body, field, value
+):
+    # A value of None means the field is left out of the payload entirely
+    payload = {**valid_request_body, field: value}
+    if value is None:
+        del payload[field]
+
+    response = await async_client.post(
+        "/fire-recovery/process/analyze_fire_severity", json=payload
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "result_path",
+    [
+        "analyze_fire_severity",
+        "refine",
+        "resolve_against_veg_map",
+    ],
+)
+async def test_result_endpoints_pending_without_stac_item(async_client, result_path):
+    response = await async_client.get(
+        f"/fire-recovery/result/{result_path}/test-fire/job-123"
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "fire_event_name": "test-fire",
+        "status": "pending",
+        "job_id": "job-123",
+    }
+
+
+def test_response_model_validation():
+    # Routes skip response validation in tests, so check the contracts directly
+    started = PROCESSING_STARTED_ADAPTER.validate_python(
+        {
+            "fire_event_name": "test-fire",
+            "status": "Processing started",
+            "job_id": "job-123",
+        }
+    )
+    assert isinstance(started, ProcessingStartedResponse)
+
+    severity = FIRE_SEVERITY_RESULT_ADAPTER.validate_python(
+        {
+            "fire_event_name": "test-fire",
+            "status": "complete",
+            "job_id": "job-123",
+            "cog_url": "https://storage.googleapis.com/bucket/rbr.tif",
+        }
+    )
+    assert isinstance(severity, FireSeverityResponse)
+
+    refined = REFINE_RESULT_ADAPTER.validate_python(
+        {
+            "fire_event_name": "test-fire",
+            "status": "complete",
+            "job_id": "job-123",
+            "refined_geojson_url": "https://storage.googleapis.com/bucket/refined.geojson",
+            "cog_url": "https://storage.googleapis.com/bucket/refined_rbr.tif",
+        }
+    )
+    assert isinstance(refined, RefinedBoundaryResponse)
+
+    with pytest.raises(ValidationError):
+        PROCESSING_STARTED_ADAPTER.validate_python(
+            {"fire_event_name": "test-fire", "status": "pending"}
+        )
@@ -1,25 +1,41 @@
+import os
+
+# Response models are checked directly in test_response_model_validation
+os.environ.setdefault("VALIDATE_API_RESPONSE", "false")
+# Processing functions are mocked, so skip importing their heavy dependencies
+os.environ.setdefault("TESTING", "1")
+
+import msgspec
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app
+from types import MappingProxyType
 
 
-@pytest.fixture
-def client():
-    return TestClient(app)
+# Shared, read-only test data. Tests that need to modify it must copy it first.
+VALID_GEOMETRY = {
+    "type": "Polygon",
+    "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]],
+}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_geometry():
-    return {
-        "type": "Polygon",
-        "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]],
-    }
+    return VALID_GEOMETRY
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_request_body(valid_geometry):
-    return {
-        "geometry": valid_geometry,
-        "prefire_date_range": ["2023-01-01", "2023-12-31"],
-        "postfire_date_range": ["2024-01-01", "2024-12-31"],
-    }
+    """Read-only; use {**valid_request_body, ...} to build a modified payload"""
+    return MappingProxyType(
+        {
+            "fire_event_name": "test-fire",
+            "geometry": valid_geometry,
+            "prefire_date_range": ["2023-01-01", "2023-12-31"],
+            "postfire_date_range": ["2024-01-01", "2024-12-31"],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def valid_request_bytes(valid_request_body):
+    """valid_request_body pre-encoded as JSON, for async_client.post(content=...)"""
+    return msgspec.json.encode(dict(valid_request_body))
@@ -0,0 +1,42 @@
+import json
+import pytest
+from src.util.polygon_ops import (
+    polygon_to_geojson_struct,
+    polygon_to_valid_geojson,
+    polygon_to_valid_geojson_bytes,
+    polygons_to_valid_geojson,
+)
+
+
+def test_polygons_to_valid_geojson_batches_features(valid_geometry):
+    feature = {"type": "Feature", "geometry": valid_geometry, "properties": {}}
+
+    result = polygons_to_valid_geojson(
+        [valid_geometry, feature], properties_list=[{"id": 1}, {"id": 2}]
+    )
+
+    assert result["type"] == "FeatureCollection"
+    assert [f["properties"] for f in result["features"]] == [{"id": 1}, {"id": 2}]
+    single = polygon_to_valid_geojson(valid_geometry, properties={"id": 1})
+    assert result["features"][0] == single["features"][0]
+
+
+def test_polygons_to_valid_geojson_rejects_non_polygon(valid_geometry):
+    # Rejected while extracting geometries, before anything is parsed
+    with pytest.raises(ValueError, match="Invalid polygon data"):
+        polygons_to_valid_geojson([valid_geometry, {"type": "Point"}])
+
+
+def test_polygon_to_geojson_struct_matches_dict_path(valid_geometry):
+    struct = polygon_to_geojson_struct(valid_geometry, properties={"id": 1})
+
+    expected = polygon_to_valid_geojson(valid_geometry, properties={"id": 1})
+    assert struct.features[0].geometry == expected["features"][0]["geometry"]
+    assert struct.as_geojson_pydantic().type == "FeatureCollection"
+
+
+def test_polygon_to_valid_geojson_bytes_round_trips(valid_geometry):
+    encoded = polygon_to_valid_geojson_bytes(valid_geometry, properties={"id": 1})
+
+    expected = polygon_to_valid_geojson(valid_geometry, properties={"id": 1})
+    assert json.loads(encoded) == expected
@@ -0,0 +1,49 @@
+import pytest
+from minio.helpers import MIN_PART_SIZE, get_part_info
+from src.util import upload_blob
+
+MiB = 1024 * 1024
+GiB = 1024 * MiB
+
+
+class StubMinio:
+    """Records fput_object calls instead of talking to GCS"""
+
+    uploads = []
+
+    def __init__(self, endpoint, **kwargs):
+        pass
+
+    def bucket_exists(self, bucket_name):
+        return True
+
+    def fput_object(self, bucket_name, object_name, file_path, **kwargs):
+        self.uploads.append(kwargs)
+
+
+def test_upload_to_gcs_uploads_parts_in_parallel(monkeypatch, tmp_path):
+    monkeypatch.setenv("GCP_ACCESS_KEY_ID", "key")
+    monkeypatch.setenv("GCP_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.setattr(upload_blob, "Minio", StubMinio)
+    monkeypatch.setattr(StubMinio, "uploads", [])
+    source = tmp_path / "rbr.tif"
+    source.write_bytes(b"cog")
+
+    url = upload_blob.upload_to_gcs(str(source), "bucket", "fire/job/rbr.tif")
+
+    assert url == "https://storage.googleapis.com/bucket/fire/job/rbr.tif"
+    # Part size is left to Minio, only the parallelism is raised
+    assert StubMinio.uploads == [
+        {
+            "content_type": "application/octet-stream",
+            "num_parallel_uploads": upload_blob.NUM_PARALLEL_UPLOADS,
+        }
+    ]
+
+
+@pytest.mark.parametrize("file_size", [1, 1 * GiB, 10 * GiB, 48 * GiB])
+def test_upload_memory_stays_bounded(file_size):
+    # Minio buffers one part per upload thread plus the one being read
+    part_size, _ = get_part_info(file_size, 0)
+    assert part_size == MIN_PART_SIZE
+    assert (upload_blob.NUM_PARALLEL_UPLOADS + 1) * part_size == 45 * MiB